@@ -1,27 +1,31 @@
+from collections.abc import Iterable
+
 from models import Room, Student
 
+
 class RoomAssigner:
     """Assign students to their respective rooms."""
 
     @staticmethod
     def assign_students(
-        rooms: list[Room], students: list[Student]
+        rooms: list[Room], students: Iterable[Student]
     ) -> list[Room]:
         """Add each student to the list of students in their assigned room.
 
         Args:
             rooms: A list of room dictionaries.
-            students: A list of student dictionaries, each with 'name' and 'room' keys.
+            students: Student dictionaries, each with 'name' and 'room' keys,
+                consumed in a single pass.
 
         Returns:
-            The list of rooms, each with an added 'students' list.
+            The list of rooms, each with an added 'students' list (empty for
+            rooms that have no students).
         """
 
+        buckets: list[list[str]] = [[] for _ in rooms]
+        append_by_room = [bucket.append for bucket in buckets]
         for student in students:
-            room_index = student["room"]
-            name = student["name"]
-            if "students" not in rooms[room_index]:
-                rooms[room_index]["students"] = []
-            rooms[room_index]["students"].append(name)
+            append_by_room[student["room"]](student["name"])
+        for room, bucket in zip(rooms, buckets):
+            room["students"] = bucket
         return rooms
-
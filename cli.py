@@ -1,6 +1,6 @@
 import argparse
 from pathlib import Path
-from readers import JSONReader
+from readers import JSONReader, StreamingJSONReader
 from writers import JSONWriter, XMLWriter
 from assigner import RoomAssigner
 from processor import RoomAssignmentProcessor
@@ -10,6 +10,10 @@ def main():
     parser.add_argument("--students", required=True)
     parser.add_argument("--rooms", required=True)
     parser.add_argument("--output-file", required=True)
+    parser.add_argument("--stream", action="store_true",
+                        help="Parse the students file incrementally (requires ijson).")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent JSON output by two spaces (default: compact).")
     args = parser.parse_args()
 
     rooms_file = Path(args.rooms)
@@ -18,15 +22,17 @@ def main():
     extension = output_file.suffix.lower()
 
     writer_map = {
-        ".json": JSONWriter(),
-        ".xml": XMLWriter()
+        ".json": lambda: JSONWriter(pretty=args.pretty),
+        ".xml": XMLWriter
     }
 
-    writer = writer_map.get(extension)
-    if not writer:
+    writer_factory = writer_map.get(extension)
+    if not writer_factory:
         raise ValueError(f"Unsupported output format: {extension}")
+    writer = writer_factory()
 
-    processor = RoomAssignmentProcessor(JSONReader(), writer, RoomAssigner())
+    reader = StreamingJSONReader() if args.stream else JSONReader()
+    processor = RoomAssignmentProcessor(reader, writer, RoomAssigner())
     processor.assign_and_export(rooms_file, students_file, output_file)
 
 if __name__ == "__main__":
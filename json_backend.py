@@ -0,0 +1,37 @@
+"""Pick the fastest installed JSON library: orjson, then ujson, then stdlib json.
+
+loads() accepts UTF-8 bytes. dumps() returns bytes when BINARY is set and
+str otherwise, so writers should open their output file accordingly. Its
+output is compact, or indented by two spaces with pretty=True, whichever
+backend is installed.
+"""
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    BINARY = True
+except ImportError:
+    try:
+        import ujson
+
+        loads = ujson.loads
+
+        def dumps(obj, pretty: bool = False) -> str:
+            return ujson.dumps(obj, indent=2 if pretty else 0, escape_forward_slashes=False)
+
+    except ImportError:
+        import json
+
+        loads = json.loads
+
+        def dumps(obj, pretty: bool = False) -> str:
+            if pretty:
+                return json.dumps(obj, indent=2)
+            return json.dumps(obj, separators=(",", ":"))
+
+    BINARY = False
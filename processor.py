@@ -24,12 +24,15 @@ class RoomAssignmentProcessor:
     ) -> None:
         """Read input files, assign students to rooms, and write the result.
 
+            Students are taken from reader.iter(), so a streaming reader
+            never holds the whole student list in memory.
+
             Args:
                 rooms_file: Path to the rooms JSON file.
                 students_file: Path to the students JSON file.
                 output_file: Path to the output file (.json or .xml).
         """
         rooms = self.reader.read(rooms_file)
-        students = self.reader.read(students_file)
+        students = self.reader.iter(students_file)
         assigned_rooms = self.assigner.assign_students(rooms, students)
         self.writer.write(output_file, assigned_rooms)
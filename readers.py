@@ -1,8 +1,9 @@
-import json
 from pathlib import Path
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import Union
 from models import Student, Room
+from json_backend import loads
 
 class BaseReader(ABC):
     @abstractmethod
@@ -17,6 +18,20 @@ class BaseReader(ABC):
         """
         pass
 
+    def iter(self, filepath: Path) -> Iterable[Student] | Iterable[Room]:
+        """Iterate over the students or rooms in a file.
+
+        Readers that can parse incrementally override this; by default the
+        whole file is read.
+
+        Args:
+            filepath: Path to the file.
+
+        Returns:
+            An iterable of students or rooms.
+        """
+        return self.read(filepath)
+
 class JSONReader(BaseReader):
     """Read JSON data from a file."""
 
@@ -29,5 +44,33 @@ class JSONReader(BaseReader):
         Returns:
             The parsed JSON content.
         """
-        with filepath.open("r", encoding="utf-8") as file:
-            return json.load(file)
+        return loads(filepath.read_bytes())
+
+
+class StreamingJSONReader(BaseReader):
+    """Read a top-level JSON array item by item using ijson."""
+
+    def read(self, filepath: Path) -> list[Student] | list[Room]:
+        """Read and parse a JSON array from a file.
+
+        Args:
+            filepath: Path to the JSON file.
+
+        Returns:
+            The parsed items of the array.
+        """
+        return list(self.iter(filepath))
+
+    def iter(self, filepath: Path) -> Iterator[Student] | Iterator[Room]:
+        """Yield the items of a JSON array as they are parsed.
+
+        Args:
+            filepath: Path to the JSON file.
+
+        Yields:
+            The items of the array, one at a time.
+        """
+        import ijson
+
+        with filepath.open("rb") as file:
+            yield from ijson.items(file, "item")
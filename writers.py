@@ -1,8 +1,16 @@
-import json
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from abc import ABC, abstractmethod
 from models import Room
+from json_backend import BINARY, dumps
+
+BUFFER_SIZE = 1 << 20
+
+
+def _escape(text: str) -> str:
+    """Escape '&', '<' and '>' in XML character data."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
 
 class BaseWriter(ABC):
     @abstractmethod
@@ -18,6 +26,15 @@ class BaseWriter(ABC):
 class JSONWriter(BaseWriter):
     """Write data to a JSON file."""
 
+    def __init__(self, pretty: bool = False):
+        """Initialize the JSONWriter.
+
+        Args:
+            pretty: Indent the output by two spaces instead of writing
+                compact JSON.
+        """
+        self.pretty = pretty
+
     def write(self, filepath: Path, data: list[Room]) -> None:
         """Write room data to a JSON file.
 
@@ -25,8 +42,13 @@ class JSONWriter(BaseWriter):
             filepath: Path to the output file.
             data: A list of dictionaries to write as JSON.
         """
-        with open(filepath, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=4)
+        payload = dumps(data, self.pretty)
+        if BINARY:
+            with open(filepath, "wb", buffering=BUFFER_SIZE) as file:
+                file.write(payload)
+        else:
+            with open(filepath, "w", encoding="utf-8", buffering=BUFFER_SIZE) as file:
+                file.write(payload)
 
 
 class XMLWriter(BaseWriter):
@@ -37,35 +59,54 @@ class XMLWriter(BaseWriter):
         """Build an XML tree from the provided room data.
 
         Args:
-            data: A list of room dictionaries, each possibly containing a
-                'students' key with a list of names.
+            data: A list of room dictionaries with 'id' and 'name' keys, each
+                possibly containing a 'students' key with a list of names.
 
         Returns:
             An ElementTree object representing the rooms and students.
         """
 
+        SubElement = ET.SubElement
         root = ET.Element("rooms")
         for room_id, room_info in enumerate(data):
-            room_elem = ET.SubElement(root, "room", id=str(room_id))
-            for key, value in room_info.items():
-                if key == "students":
-                    students_elem = ET.SubElement(room_elem, "students")
-                    for student_name in value:
-                        ET.SubElement(students_elem, "student").text = student_name
-                else:
-                    ET.SubElement(room_elem, key).text = str(value)
+            room_elem = SubElement(root, "room", id=str(room_id))
+            SubElement(room_elem, "id").text = str(room_info["id"])
+            SubElement(room_elem, "name").text = room_info["name"]
+            students = room_info.get("students")
+            if students is not None:
+                students_elem = SubElement(room_elem, "students")
+                for student_name in students:
+                    SubElement(students_elem, "student").text = student_name
 
         tree = ET.ElementTree(root)
         return tree
 
     def write(self, filepath: Path, data: list[Room]) -> None:
-        """Write data to an XML file.
+        """Stream data to an XML file without building an element tree.
+
+        The output is equivalent to serializing the tree from build_tree().
 
         Args:
             filepath: Path to the output XML file.
             data: A list of room dictionaries.
         """
 
-        tree = self.build_tree(data)
-        tree.write(filepath, encoding="utf-8", xml_declaration=True)
+        with open(filepath, "wb", buffering=BUFFER_SIZE) as file:
+            write = file.write
+            writelines = file.writelines
+            write(b'<?xml version="1.0" encoding="utf-8"?>\n<rooms>')
+            for room_id, room_info in enumerate(data):
+                write(
+                    f'<room id="{room_id}"><id>{room_info["id"]}</id>'
+                    f'<name>{_escape(room_info["name"])}</name>'.encode()
+                )
+                students = room_info.get("students")
+                if students is not None:
+                    write(b"<students>")
+                    writelines(
+                        f"<student>{_escape(name)}</student>".encode() for name in students
+                    )
+                    write(b"</students>")
+                write(b"</room>")
+            write(b"</rooms>")
 